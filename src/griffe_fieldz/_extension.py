@@ -6,12 +6,11 @@ import inspect
 import textwrap
 from typing import TYPE_CHECKING, Any, Iterable, Sequence
 
-import fieldz
-from fieldz._repr import display_as_type
 from griffe import (
     Class,
     Docstring,
     DocstringAttribute,
+    DocstringNamedElement,
     DocstringParameter,
     DocstringSection,
     DocstringSectionAttributes,
@@ -27,10 +26,20 @@ from griffe import (
 if TYPE_CHECKING:
     import ast
 
+    import fieldz
     from griffe import Expr, Inspector, Visitor
 
 logger = get_logger(__name__)
 
+# reprs of the empty containers made by common (builtin) default factories
+_KNOWN_EMPTY_FACTORIES: dict[type, str] = {
+    list: "[]",
+    dict: "{}",
+    set: "set()",
+    tuple: "()",
+    frozenset: "frozenset()",
+}
+
 
 class FieldzExtension(Extension):
     """Griffe extension that injects field information for dataclass-likes."""
@@ -42,10 +51,18 @@ class FieldzExtension(Extension):
         include_inherited: bool = False,
         **kwargs: Any,
     ) -> None:
-        self.object_paths = object_paths
+        self.object_paths = frozenset(object_paths) if object_paths else None
         self._kwargs = kwargs
         self.include_private = include_private
         self.include_inherited = include_inherited
+        # runtime objects by path (None for paths that failed to import)
+        self._import_cache: dict[str, Any] = {}
+        # whether fieldz supports the object at each path
+        self._adapter_cache: dict[str, bool] = {}
+        # display strings of field types, keyed by id() of the type object (which
+        # is kept alive by the entry).  Not keyed by the type itself: typing objects
+        # can compare equal yet render differently (Union[int, str] == Union[str, int])
+        self._type_display_cache: dict[int, tuple[Any, str]] = {}
 
     def on_class_instance(
         self,
@@ -61,100 +78,166 @@ class FieldzExtension(Extension):
         if self.object_paths and cls.path not in self.object_paths:
             return  # skip objects that were not selected
 
+        if not cls.bases and not cls.decorators and not cls.keywords:
+            # dataclass-likes need a decorator (dataclass, attrs), a base (pydantic,
+            # msgspec, TypedDict...) or a keyword such as `metaclass=`: don't bother
+            # importing plain classes
+            return
+
         # import object to get its evaluated docstring
-        try:
-            runtime_obj = dynamic_import(cls.path)
-        except ImportError:
-            logger.debug(f"Could not get dynamic docstring for {cls.path}")
+        runtime_obj = self._import(cls.path)
+        if runtime_obj is None:
             return
 
-        try:
-            fieldz.get_adapter(runtime_obj)
-        except TypeError:
+        if not self._is_supported(cls.path, runtime_obj):
             return
         self._inject_fields(cls, runtime_obj)
 
     # ------------------------------
 
+    def _import(self, path: str) -> Any:
+        """Import `path`, remembering failures so they are not retried."""
+        if path not in self._import_cache:
+            try:
+                self._import_cache[path] = dynamic_import(path)
+            except ImportError:
+                logger.debug(f"Could not get dynamic docstring for {path}")
+                self._import_cache[path] = None
+        return self._import_cache[path]
+
+    def _is_supported(self, path: str, runtime_obj: Any) -> bool:
+        """Return whether fieldz supports `runtime_obj`."""
+        if path not in self._adapter_cache:
+            import fieldz
+
+            try:
+                fieldz.get_adapter(runtime_obj)
+            except TypeError:
+                self._adapter_cache[path] = False
+            else:
+                self._adapter_cache[path] = True
+        return self._adapter_cache[path]
+
     def _inject_fields(self, obj: Object, runtime_obj: Any) -> None:
         # update the object instance with the evaluated docstring
-        docstring = inspect.cleandoc(getattr(runtime_obj, "__doc__", "") or "")
         if not obj.docstring:
+            docstring = inspect.cleandoc(getattr(runtime_obj, "__doc__", "") or "")
             obj.docstring = Docstring(docstring, parent=obj)
         sections = obj.docstring.parsed
 
         # collect field info
+        import fieldz
+
         fields = fieldz.fields(runtime_obj)
         if not self.include_inherited:
             annotations = getattr(runtime_obj, "__annotations__", {})
             fields = tuple(f for f in fields if f.name in annotations)
 
-        params, attrs = _fields_to_params(fields, obj.docstring, self.include_private)
+        params, attrs = _fields_to_params(
+            fields, obj.docstring, self._type_display_cache, self.include_private
+        )
+
+        # index the first section of each kind (exact type: a subclass like
+        # DocstringSectionOtherParameters is not the Parameters section)
+        by_type: dict[type, DocstringSection] = {}
+        for section in sections:
+            by_type.setdefault(type(section), section)
 
         # merge/add field info to docstring
         if params:
-            for x in sections:
-                if isinstance(x, DocstringSectionParameters):
-                    _merge(x, params)
-                    break
+            if (p_sect := by_type.get(DocstringSectionParameters)) is not None:
+                _merge(p_sect, params)
             else:
                 sections.insert(1, DocstringSectionParameters(params))
         if attrs:
-            for x in sections:
-                if isinstance(x, DocstringSectionAttributes):
-                    _merge(x, params)
-                    break
+            if (a_sect := by_type.get(DocstringSectionAttributes)) is not None:
+                _merge(a_sect, attrs)
             else:
                 sections.append(DocstringSectionAttributes(attrs))
 
 
-def _to_annotation(type_: Any, docstring: Docstring) -> str | Expr | None:
+def _to_annotation(
+    type_: Any, docstring: Docstring, display_cache: dict[int, tuple[Any, str]]
+) -> str | Expr | None:
     """Create griffe annotation for a type."""
     if type_:
-        return parse_docstring_annotation(
-            display_as_type(type_, modern_union=True), docstring
-        )
+        text = _display_type(type_, display_cache)
+        return parse_docstring_annotation(text, docstring)
     return None
 
 
+def _display_type(type_: Any, cache: dict[int, tuple[Any, str]]) -> str:
+    """Return the string representation of a type, cached in `cache`."""
+    entry = cache.get(id(type_))
+    if entry is None:
+        from fieldz._repr import display_as_type
+
+        text = display_as_type(type_, modern_union=True)
+        entry = cache[id(type_)] = (type_, text)
+    return entry[1]
+
+
 def _default_repr(field: fieldz.Field) -> str | None:
     """Return a repr for a field default."""
     if field.default is not field.MISSING:
         return repr(field.default)
     if field.default_factory is not field.MISSING:
-        return repr(field.default_factory())
+        factory = field.default_factory
+        if isinstance(factory, type) and factory in _KNOWN_EMPTY_FACTORIES:
+            return _KNOWN_EMPTY_FACTORIES[factory]
+        return repr(factory())
     return None
 
 
 def _fields_to_params(
     fields: Iterable[fieldz.Field],
     docstring: Docstring,
+    display_cache: dict[int, tuple[Any, str]],
     include_private: bool = False,
 ) -> tuple[list[DocstringParameter], list[DocstringAttribute]]:
     """Get all docstring attributes and parameters for fields."""
     params: list[DocstringParameter] = []
     attrs: list[DocstringAttribute] = []
+    # parsed annotations resolve names against `docstring.parent`, so they can
+    # only be shared between fields of this class (keyed by id of the type)
+    annotations: dict[int, str | Expr | None] = {}
     for field in fields:
+        if not field.init and not include_private and field.name.startswith("_"):
+            continue  # skip private attributes
+
         description = field.description or field.metadata.get("description", "") or ""
-        kwargs: dict = {
-            "name": field.name,
-            "annotation": _to_annotation(field.type, docstring),
-            "description": textwrap.dedent(description).strip(),
-            "value": _default_repr(field),
-        }
+        if "\n" in description:  # single lines only need stripping
+            description = textwrap.dedent(description)
+        description = description.strip()
+        if (type_id := id(field.type)) not in annotations:
+            annotations[type_id] = _to_annotation(field.type, docstring, display_cache)
+        annotation = annotations[type_id]
+        value = _default_repr(field)
         if field.init:
-            params.append(DocstringParameter(**kwargs))
-        elif include_private or not field.name.startswith("_"):
-            attrs.append(DocstringAttribute(**kwargs))
+            params.append(
+                DocstringParameter(
+                    field.name,
+                    description=description,
+                    annotation=annotation,
+                    value=value,
+                )
+            )
+        else:
+            attrs.append(
+                DocstringAttribute(
+                    field.name,
+                    description=description,
+                    annotation=annotation,
+                    value=value,
+                )
+            )
 
     return params, attrs
 
 
 def _merge(
-    section: DocstringSection, field_params: Sequence[DocstringParameter]
+    section: DocstringSection, field_params: Sequence[DocstringNamedElement]
 ) -> None:
     """Update DocstringSection with field params (if missing)."""
     existing_names = {x.name for x in section.value}
-    for param in field_params:
-        if param.name not in existing_names:
-            section.value.append(param)
+    section.value.extend(p for p in field_params if p.name not in existing_names)
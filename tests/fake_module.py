@@ -6,3 +6,77 @@ class SomeDataclass:
     """SomeDataclass."""
 
     x: int = field(default=1, metadata={"description": "The x field."})
+
+
+@dataclass
+class WithAttributes:
+    """WithAttributes.
+
+    Attributes
+    ----------
+    y : int
+        The y attribute.
+    """
+
+    x: int = 1
+    z: int = field(default=2, init=False)
+
+
+class CountingList(list):
+    """List that counts how often it is instantiated."""
+
+    calls = 0
+
+    def __init__(self) -> None:
+        type(self).calls += 1
+        super().__init__()
+
+
+@dataclass
+class WithFactories:
+    """WithFactories."""
+
+    a: list = field(default_factory=list)
+    b: dict = field(default_factory=dict)
+    c: list = field(default_factory=CountingList)
+
+
+class PlainClass:
+    """PlainClass."""
+
+    x: int = 1
+
+
+class Meta(type):
+    pass
+
+
+class WithMetaclass(metaclass=Meta):
+    """WithMetaclass."""
+
+
+class SomeDataclassChild(SomeDataclass):
+    """SomeDataclassChild."""
+
+
+# the same path defined twice (griffe visits both), and not importable at runtime
+@dataclass
+class Removed:
+    """Removed."""
+
+
+@dataclass
+class Removed:  # type: ignore[no-redef]  # noqa: F811
+    """Removed."""
+
+
+del Removed
+
+
+# the same path defined twice, importable but not supported by fieldz
+class PlainClassChild(PlainClass):
+    """PlainClassChild."""
+
+
+class PlainClassChild(PlainClass):  # type: ignore[no-redef]  # noqa: F811
+    """PlainClassChild."""
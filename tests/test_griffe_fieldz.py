@@ -1,19 +1,44 @@
 """Tests for the Griffe extension."""
 
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+import fieldz
+import pytest
+from fieldz import get_adapter
 from griffe import (
     DocstringParameter,
+    DocstringSection,
+    DocstringSectionAttributes,
     DocstringSectionParameters,
     ExprName,
     Extensions,
     GriffeLoader,
+    Module,
+    dynamic_import,
 )
 
-from griffe_fieldz import FieldzExtension
+from griffe_fieldz import FieldzExtension, _extension
+
+from .fake_module import CountingList
+
+S = TypeVar("S", bound=DocstringSection)
 
 
-def test_extension() -> None:
+def _section(sections: list[DocstringSection], kind: type[S]) -> S:
+    """Return the first section of exactly type `kind`."""
+    return next(s for s in sections if type(s) is kind)
+
+
+@pytest.fixture(scope="session")
+def fake_mod() -> Module:
+    """tests.fake_module, loaded once with the default loader and options."""
     loader = GriffeLoader(extensions=Extensions(FieldzExtension()))
-    fake_mod = loader.load("tests.fake_module")
+    return loader.load("tests.fake_module")  # type: ignore[return-value]
+
+
+def test_extension(fake_mod: Module) -> None:
     sections = fake_mod["SomeDataclass"].docstring.parsed
     assert len(sections) == 2
     sec1 = sections[1]
@@ -25,3 +50,85 @@ def test_extension() -> None:
     assert p0.annotation.name == "int"
     assert p0.description == "The x field."
     assert p0.value == "1"
+
+
+def test_merge_into_existing_attributes() -> None:
+    loader = GriffeLoader(
+        extensions=Extensions(FieldzExtension()), docstring_parser="numpy"
+    )
+    fake_mod = loader.load("tests.fake_module")
+    sections = fake_mod["WithAttributes"].docstring.parsed
+    params = _section(sections, DocstringSectionParameters)
+    attrs = _section(sections, DocstringSectionAttributes)
+    assert [p.name for p in params.value] == ["x"]
+    assert [a.name for a in attrs.value] == ["y", "z"]
+
+
+def test_object_paths() -> None:
+    ext = FieldzExtension(object_paths=["tests.fake_module.WithAttributes"])
+    loader = GriffeLoader(extensions=Extensions(ext))
+    fake_mod = loader.load("tests.fake_module")
+    assert len(fake_mod["SomeDataclass"].docstring.parsed) == 1
+    assert len(fake_mod["WithAttributes"].docstring.parsed) == 3
+
+
+def test_plain_class() -> None:
+    ext = FieldzExtension()
+    fake_mod = GriffeLoader(extensions=Extensions(ext)).load("tests.fake_module")
+    # no bases, decorators or keywords: never imported, nothing injected
+    assert "tests.fake_module.PlainClass" not in ext._import_cache
+    assert len(fake_mod["PlainClass"].docstring.parsed) == 1
+    # a class keyword alone (e.g. `metaclass=`) is enough to be considered
+    assert "tests.fake_module.WithMetaclass" in ext._import_cache
+
+
+def test_undecorated_subclass() -> None:
+    ext = FieldzExtension(include_inherited=True)
+    loader = GriffeLoader(extensions=Extensions(ext))
+    fake_mod = loader.load("tests.fake_module")
+    sections = fake_mod["SomeDataclassChild"].docstring.parsed
+    params = _section(sections, DocstringSectionParameters)
+    assert [p.name for p in params.value] == ["x"]
+
+
+def test_failed_import_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _dynamic_import(path: str) -> Any:
+        calls.append(path)
+        return dynamic_import(path)
+
+    monkeypatch.setattr(_extension, "dynamic_import", _dynamic_import)
+    ext = FieldzExtension()
+    GriffeLoader(extensions=Extensions(ext)).load("tests.fake_module")
+    # `Removed` is defined twice but deleted at runtime
+    assert calls.count("tests.fake_module.Removed") == 1
+    assert ext._import_cache["tests.fake_module.Removed"] is None
+
+
+def test_unsupported_class_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Any] = []
+
+    def _get_adapter(obj: Any) -> Any:
+        calls.append(obj)
+        return get_adapter(obj)
+
+    monkeypatch.setattr(fieldz, "get_adapter", _get_adapter)
+    ext = FieldzExtension()
+    fake_mod = GriffeLoader(extensions=Extensions(ext)).load("tests.fake_module")
+    # `PlainClassChild` is defined twice, and fieldz doesn't support it
+    assert sum(c.__name__ == "PlainClassChild" for c in calls) == 1
+    assert ext._adapter_cache["tests.fake_module.PlainClassChild"] is False
+    assert len(fake_mod["PlainClassChild"].docstring.parsed) == 1
+
+
+def test_known_empty_factories(monkeypatch: pytest.MonkeyPatch) -> None:
+    # known factories get their repr from the table, without being called
+    monkeypatch.setitem(_extension._KNOWN_EMPTY_FACTORIES, CountingList, "[]")
+    calls = CountingList.calls
+    loader = GriffeLoader(extensions=Extensions(FieldzExtension()))
+    fake_mod = loader.load("tests.fake_module")
+    sections = fake_mod["WithFactories"].docstring.parsed
+    params = _section(sections, DocstringSectionParameters)
+    assert [p.value for p in params.value] == ["[]", "{}", "[]"]
+    assert CountingList.calls == calls